@@ -2,196 +2,345 @@
 # careers page and organizes the extracted information into a structured Excel file.
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+import aiohttp
+import asyncio
+import lxml.html
+from lxml import etree
 import pandas as pd
-import openpyxl
-from openpyxl.styles import Font, PatternFill, Border, Side, Alignment
-from openpyxl.utils.dataframe import dataframe_to_rows
+import xlsxwriter
 import re
+import string
 from datetime import datetime
+from urllib.parse import urljoin, urldefrag, urlsplit, urlunsplit, parse_qsl, urlencode
+from concurrent.futures import ProcessPoolExecutor
+import argparse
+import importlib.util
 import os
 
 BASE_URL = "https://techversantinfotech.com/talent/"
-# Extracts job data from a single job section and returns it as a dictionary
-def extract_job_data(job_section):
-    job_data = {}
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
 
+# Shared HTTP session so repeated page fetches reuse pooled keep-alive TCP/TLS connections
+_SESSION = requests.Session()
+_SESSION.headers.update({'User-Agent': USER_AGENT})
+_SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+# Supported output file formats (see save_jobs)
+OUTPUT_FORMATS = ('xlsx', 'csv', 'parquet')
+
+# Output columns, in the order they appear in the Excel file
+JOB_FIELDS = (
+    'JobTitle', 'JobCategory', 'Location', 'ExperienceRequired',
+    'PostingDate', 'JobDescriptionSummary', 'SkillsRequired',
+    'ContactEmail', 'CompanyBenefits', 'Salary', 'JobURL',
+    'JobID', 'ScrapedDate', 'SourceURL'
+)
+
+# Experience phrases, compiled once into a single alternation so each job needs one regex pass.
+# Patterns are lowercase and matched against lowercased text, which is cheaper than re.IGNORECASE.
+_EXP_RE = re.compile(
+    r'(\d+\+?\s*years?\s*of\s*experience'
+    r'|minimum\s*of\s*\d+\s*years'
+    r'|\d+\+\s*years?\s*in'
+    r'|minimum\s*\d+\s*years)'
+)
+# ASCII-only lowercasing keeps every character at its offset (unlike str.lower(), e.g. 'İ' -> 'i̇'),
+# so match spans can be used to slice the original text
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+# Page parser: libxml2 drops comments and processing instructions while parsing, so no nodes are
+# built for them. Worker processes re-parse serialized sections with lxml's default parser.
+_HTML_PARSER = lxml.html.HTMLParser(remove_comments=True, remove_pis=True)
+
+# XPath predicate matching one whole class token (like BeautifulSoup's class_), so e.g.
+# "crr_app_stt_wrap" or "swiper-pager" don't match "crr_app_stt" / "pager"
+_HAS_CLASS = 'contains(concat(" ", normalize-space(@class), " "), " {} ")'
+
+# Pre-compiled XPath queries for the job postings (evaluated by libxml2, not Python)
+_XP_JOB_SECTIONS = etree.XPath(f'//section[{_HAS_CLASS.format("crr_app_stt")}]')
+_XP_TITLE = etree.XPath(f'string(.//h3[{_HAS_CLASS.format("crr_app_hh")}])')
+_XP_CATEGORY = etree.XPath(f'string(.//span[{_HAS_CLASS.format("crr_app_tp")} and {_HAS_CLASS.format("bluecrr")}])')
+_XP_LOCATION = etree.XPath(f'string(.//span[{_HAS_CLASS.format("crr_app_plc")}])')
+_XP_APPLY_BUTTON = etree.XPath(f'.//a[{_HAS_CLASS.format("crr_app_nw")}]')
+_XP_POSTED = etree.XPath('.//p[contains(text(), "Posted on")]')
+_XP_DESC_LIST = etree.XPath(
+    '(.//strong[contains(translate(., "ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz"),'
+    ' "job description")])[1]/ancestor::p[1]/following-sibling::ul[1]'
+)
+_XP_SKILLS = etree.XPath(
+    './/strong[contains(., "Preferred Skills") or contains(., "Required Skills")'
+    ' or contains(., "Must-Have Skills") or contains(., "Technical Stack")]'
+    '/parent::*/following-sibling::ul[1]//li'
+)
+_XP_EMAIL_HREF = etree.XPath('.//a[starts-with(@href, "mailto:")]/@href')
+_XP_EXPERIENCE_TEXT = etree.XPath('.//p//text() | .//li//text()', smart_strings=False)
+_XP_BENEFITS = etree.XPath('(.//strong[. = "What Company Offers:"])[1]/parent::*/following-sibling::p[1]')
+
+# Pagination lookups: link/button captions are pulled out in one XPath pass and scanned by a single regex
+_XP_PAGINATION_CONTAINERS = etree.XPath(
+    f'boolean(//div[{_HAS_CLASS.format("pagination")}] | //nav[{_HAS_CLASS.format("pagination")}]'
+    f' | //div[{_HAS_CLASS.format("pager")}] | //ul[{_HAS_CLASS.format("pagination")}])'
+)
+# (captions may be wrapped in one inline element, e.g. <a><span>Next</span></a>, like BeautifulSoup's .string)
+_XP_LINK_TEXTS = etree.XPath('//a[not(*[2])]//text()')
+_XP_BUTTON_TEXTS = etree.XPath('//button[not(*[2])]//text()')
+_NEXT_LINK_RE = re.compile(r'next|more|»|>|page')
+_LOAD_MORE_RE = re.compile(r'load more')
+_XP_PAGE_HREFS = etree.XPath(
+    f'//*[{_HAS_CLASS.format("pagination")} or {_HAS_CLASS.format("pager")}]//a/@href | //a[@rel = "next"]/@href'
+)
+# "/page/1/" path suffix that just addresses the first result page again
+_FIRST_PAGE_PATH_RE = re.compile(r'/page/1/?$')
+
+# Excel cell styles, registered once per workbook (see _add_cell_formats) and shared by both sheets
+_CELL_FORMATS = {
+    'header': {
+        'bold': True, 'font_color': 'white', 'font_size': 12, 'bg_color': '#366092',
+        'align': 'center', 'valign': 'vcenter', 'text_wrap': True, 'border': 1
+    },
+    'data': {'valign': 'top', 'text_wrap': True, 'border': 1},
+    'summary_header': {'bold': True, 'font_color': 'white', 'bg_color': '#366092'},
+    'section': {'bold': True},
+}
+
+# Extra pages are fetched concurrently, with at most this many connections to the careers site at once
+_MAX_CONNECTIONS_PER_HOST = 8
+# Upper bound on the extra result pages followed, in case a pager links to an endless range
+_MAX_EXTRA_PAGES = 50
+
+# Below this many job postings a process pool costs more (start-up, serializing and re-parsing
+# every section) than it saves, so the already-parsed sections are extracted in-process
+_PROCESS_POOL_MIN_JOBS = 16
+
+# Extracts job data from a single job section (an lxml element) scraped from source_url
+# and returns it as a dictionary
+def extract_job_data(job_section, source_url=BASE_URL):
+    # Every field starts as None (not 'N/A') so anything missing becomes a blank cell;
+    # each lookup below only fills in a field when its element is actually present
+    job_data = dict.fromkeys(JOB_FIELDS)
+
+    # Primary fields
+    job_data['JobTitle'] = _XP_TITLE(job_section).strip() or None
+    job_data['JobCategory'] = _XP_CATEGORY(job_section).strip() or None
+    job_data['Location'] = _XP_LOCATION(job_section).strip() or None
+
+    # Apply button and job ID
+    if apply_buttons := _XP_APPLY_BUTTON(job_section):
+        job_data['JobURL'] = apply_buttons[0].get('href')
+        job_data['JobID'] = apply_buttons[0].get('datatitle')
+
+    # Posting date
+    if posting_dates := _XP_POSTED(job_section):
+        job_data['PostingDate'] = posting_dates[0].text_content().strip() or None
+
+    # Job Description extraction using 'Job Description' heading:
+    # the <ul> following the heading's parent <p> contains the responsibilities
+    job_description = []
+    if desc_lists := _XP_DESC_LIST(job_section):
+        for li in desc_lists[0].iterdescendants('li'):
+            if nested_ul := li.findall('.//ul'):
+                for sub_ul in nested_ul:
+                    for sub_li in sub_ul.iterdescendants('li'):
+                        job_description.append(sub_li.text_content().strip())
+            else:
+                job_description.append(li.text_content().strip())
+
+    # Join description bullets into one string
+    if job_description:
+        job_data['JobDescriptionSummary'] = '\n'.join(job_description)
+
+    # Experience requirement extraction - only the paragraph and bullet text is searched,
+    # not the whole section (headings, buttons, links). Free-form text is the one place
+    # unexpected input can break extraction, so a failure here only blanks this field.
     try:
-        # Primary fields - use empty string for missing data (not 'N/A')
-        job_title_elem = job_section.find('h3', class_='crr_app_hh')
-        job_data['JobTitle'] = job_title_elem.get_text(strip=True) if job_title_elem else ''
-        
-        job_category_elem = job_section.find('span', class_='crr_app_tp bluecrr')
-        job_data['JobCategory'] = job_category_elem.get_text(strip=True) if job_category_elem else ''
-        
-        location_elem = job_section.find('span', class_='crr_app_plc')
-        job_data['Location'] = location_elem.get_text(strip=True) if location_elem else ''
-
-        # Apply button and job ID
-        apply_button = job_section.find('a', class_='crr_app_nw')
-        job_data['JobURL'] = apply_button.get('href') if apply_button else ''
-        job_data['JobID'] = apply_button.get('datatitle') if apply_button else ''
-
-        # Posting date
-        posting_date_elem = job_section.find('p', string=lambda text: text and 'Posted on' in text)
-        job_data['PostingDate'] = posting_date_elem.get_text(strip=True) if posting_date_elem else ''
-
-        # Job Description Summary
-        # desc_section = job_section.find('strong', string='What\'s important to us:')
-        # if desc_section:
-        #     desc_para = desc_section.parent.find_next_sibling('p')
-        #     job_data['JobDescriptionSummary'] = desc_para.get_text(strip=True) if desc_para else ''
-        # else:
-        #     job_data['JobDescriptionSummary'] = ''
-
-        # Job Description extraction using 'Job Description' heading
-        desc_heading = job_section.find('strong', string=lambda text: text and 'job description' in text.lower())
-        job_description = []
-
-        if desc_heading:
-            # Go up to the parent <p>, then find the next <ul> which contains responsibilities
-            ul_section = desc_heading.find_parent('p').find_next_sibling('ul')
-            
-            if ul_section:
-                lis = ul_section.find_all('li')
-                for li in lis:
-                    nested_ul = li.find_all('ul')
-                    if nested_ul:
-                        for sub_ul in nested_ul:
-                            for sub_li in sub_ul.find_all('li'):
-                                job_description.append(sub_li.get_text(strip=True))
-                    else:
-                        job_description.append(li.get_text(strip=True))
-
-        # Join description bullets into one string
-        job_data['JobDescriptionSummary'] = '\n'.join(job_description) if job_description else ''
-
-
-        # Experience requirement extraction
-        full_text = job_section.get_text()
-        experience_patterns = [
-            r'(\d+\+?\s*years?\s*of\s*experience)',
-            r'(Minimum\s*of\s*\d+\s*years)',
-            r'(\d+\+\s*years?\s*in)',
-            r'(minimum\s*\d+\s*years)'
-        ]
-        
-        experience_found = None
-        for pattern in experience_patterns:
-            experience_match = re.search(pattern, full_text, re.IGNORECASE)
-            if experience_match:
-                experience_found = experience_match.group(0)
-                break
-        
-        # Leave blank if no experience found (not 'N/A')
-        job_data['ExperienceRequired'] = experience_found if experience_found else ''
+        experience_text = ' '.join(_XP_EXPERIENCE_TEXT(job_section))
+        # Leave blank if no experience found; slice the original text to keep its casing
+        if experience_match := _EXP_RE.search(experience_text.translate(_ASCII_LOWER)):
+            job_data['ExperienceRequired'] = experience_text[experience_match.start():experience_match.end()]
+    except Exception as e:
+        print(f"⚠️  Could not extract experience for a job posting: {str(e)}")
 
-        # Skills extraction
-        skills_sections = job_section.find_all('strong', string=lambda text: text and any(
-            keyword in text for keyword in ['Preferred Skills', 'Required Skills', 'Must-Have Skills', 'Technical Stack']
-        ))
-        
-        all_skills = []
-        for skills_section in skills_sections:
-            skills_list = skills_section.parent.find_next_sibling('ul')
-            if skills_list:
-                skills = [li.get_text(strip=True) for li in skills_list.find_all('li')]
-                all_skills.extend(skills)
-        
-        job_data['SkillsRequired'] = '; '.join(all_skills) if all_skills else ''
+    # Skills extraction - every <li> of the list following each skills heading, in one XPath pass
+    if all_skills := [li.text_content().strip() for li in _XP_SKILLS(job_section)]:
+        job_data['SkillsRequired'] = '; '.join(all_skills)
 
-        # Contact email
-        email_link = job_section.find('a', href=lambda href: href and 'mailto:' in href)
-        job_data['ContactEmail'] = email_link.get('href').replace('mailto:', '') if email_link else ''
+    # Contact email
+    if email_hrefs := _XP_EMAIL_HREF(job_section):
+        job_data['ContactEmail'] = email_hrefs[0].replace('mailto:', '') or None
 
-        # Company benefits
-        benefits_section = job_section.find('strong', string='What Company Offers:')
-        if benefits_section:
-            benefits_text = benefits_section.parent.find_next_sibling('p')
-            job_data['CompanyBenefits'] = benefits_text.get_text(strip=True) if benefits_text else ''
-        else:
-            job_data['CompanyBenefits'] = ''
+    # Company benefits
+    if benefits_paras := _XP_BENEFITS(job_section):
+        job_data['CompanyBenefits'] = benefits_paras[0].text_content().strip() or None
 
-        # Salary - leave blank as it's typically not specified
-        job_data['Salary'] = ''
+    # Salary - left blank (None) as it's typically not specified
 
-        # Add scraping metadata
-        job_data['ScrapedDate'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        job_data['SourceURL'] = BASE_URL
+    # Add scraping metadata
+    job_data['ScrapedDate'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    job_data['SourceURL'] = source_url
 
-    except AttributeError as e:
-        print(f"⚠️  HTML structure issue for a job posting: {str(e)}")
-        # Return None to skip this job rather than error data
-        return None
+    return job_data
+
+# Serializes job sections to HTML strings for the process pool (lxml elements cannot be pickled)
+def _serialize_sections(job_sections):
+    return [lxml.html.tostring(section, encoding='unicode', with_tail=False) for section in job_sections]
+
+# Extracts a single job, logging and returning None on an unexpected error so that one
+# malformed section is skipped instead of aborting the whole scrape
+def _extract_job_or_none(job_section, source_url=BASE_URL):
+    try:
+        return extract_job_data(job_section, source_url)
     except Exception as e:
         print(f"❌ Error extracting job data: {str(e)}")
         return None
 
-    return job_data
+# Re-parses a serialized job section and extracts its data (top-level so worker processes can pickle it)
+def _extract_from_html(html, source_url=BASE_URL):
+    return _extract_job_or_none(lxml.html.fragment_fromstring(html), source_url)
 
-# Checks if the soup object contains pagination elements
-def check_pagination(soup):
-    # Look for common pagination patterns
-    pagination_indicators = [
-        soup.find('div', class_='pagination'),
-        soup.find('nav', class_='pagination'), 
-        soup.find('div', class_='pager'),
-        soup.find('ul', class_='pagination'),
-        soup.find('a', string=lambda text: text and any(word in text.lower() for word in ['next', 'more', '»', '>', 'page'])),
-        soup.find('button', string=lambda text: text and 'load more' in text.lower()),
-    ]
+# Drops repeated postings (the same job reachable from more than one result page), keyed by JobID
+# or, failing that, JobURL; jobs with neither are always kept
+def _dedupe_jobs(jobs_data):
+    unique_jobs = []
+    seen_keys = set()
+    for job in jobs_data:
+        key = ('JobID', job['JobID']) if job.get('JobID') else ('JobURL', job.get('JobURL'))
+        if key[1] is not None:
+            if key in seen_keys:
+                continue
+            seen_keys.add(key)
+        unique_jobs.append(job)
+    return unique_jobs
+
+# Checks if the parsed page contains pagination elements, stopping at the first kind of indicator found
+def check_pagination(tree):
+    # Look for common pagination containers with one combined query
+    if _XP_PAGINATION_CONTAINERS(tree):
+        return True
     
-    has_pagination = any(indicator for indicator in pagination_indicators)
-    return has_pagination
+    # Fall back to "next"/"load more" style link and button captions
+    if _NEXT_LINK_RE.search('\n'.join(_XP_LINK_TEXTS(tree)).lower()):
+        return True
+    return bool(_LOAD_MORE_RE.search('\n'.join(_XP_BUTTON_TEXTS(tree)).lower()))
 
-# Saves the list of job dictionaries to an Excel file with formatting and summary
+# Returns the canonical form of a result-page URL so each page is fetched only once: the fragment
+# is dropped and first-page aliases ("?page=1", "?paged=1", "/page/1/") map to the plain URL
+def _canonical_page_url(url):
+    parts = urlsplit(urldefrag(url)[0])
+    query = [(key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+             if not (key in ('page', 'paged') and value == '1')]
+    path = _FIRST_PAGE_PATH_RE.sub('/', parts.path)
+    return urlunsplit((parts.scheme, parts.netloc, path, urlencode(query), ''))
+
+# Collects the canonical URLs of result pages linked from the pagination controls of the page at
+# page_url, skipping (and then recording) every URL already in seen_urls
+def collect_page_urls(tree, page_url, seen_urls):
+    page_urls = []
+    for href in _XP_PAGE_HREFS(tree):
+        url = urljoin(page_url, href.strip())
+        if not url.startswith('http'):
+            continue
+        url = _canonical_page_url(url)
+        if url not in seen_urls:
+            seen_urls.add(url)
+            page_urls.append(url)
+    return page_urls
+
+# Downloads a single page and returns its raw body
+async def _fetch(session, url):
+    async with session.get(url) as response:
+        response.raise_for_status()
+        return await response.read()
+
+# Downloads and parses result pages concurrently, following each fetched page's own pager links
+# until no new pages turn up (so shortened pagers like "1 2 3 … 10" are fully covered).
+# Returns (url, tree) pairs; a page that fails to download or parse is paired with the exception
+# instead, so one bad page doesn't abort the batch.
+async def _scrape_all_pages(urls, seen_urls):
+    pages = []
+    connector = aiohttp.TCPConnector(limit_per_host=_MAX_CONNECTIONS_PER_HOST)
+    timeout = aiohttp.ClientTimeout(total=30)
+    async with aiohttp.ClientSession(headers={'User-Agent': USER_AGENT}, connector=connector, timeout=timeout) as session:
+        while urls:
+            if len(pages) + len(urls) > _MAX_EXTRA_PAGES:
+                print(f"⚠️  Page limit reached - following at most {_MAX_EXTRA_PAGES} extra pages")
+                urls = urls[:_MAX_EXTRA_PAGES - len(pages)]
+            
+            bodies = await asyncio.gather(*[_fetch(session, url) for url in urls], return_exceptions=True)
+            next_urls = []
+            for url, body in zip(urls, bodies):
+                if isinstance(body, Exception):
+                    pages.append((url, body))
+                    continue
+                # A page that downloads but cannot be parsed (e.g. an empty body) is skipped the same way
+                try:
+                    page_tree = lxml.html.fromstring(body, parser=_HTML_PARSER)
+                except (etree.ParserError, ValueError) as e:
+                    pages.append((url, e))
+                    continue
+                pages.append((url, page_tree))
+                next_urls.extend(collect_page_urls(page_tree, url, seen_urls))
+            urls = next_urls
+    return pages
+
+# Builds the jobs DataFrame column by column (one list per field, already in display order),
+# so pandas wraps ready-made columns instead of regrouping row dictionaries.
+# Missing fields are already None, so they become blank cells without a replace pass.
+def _jobs_dataframe(jobs_data):
+    return pd.DataFrame({field: [job.get(field) for job in jobs_data] for field in JOB_FIELDS})
+
+# Returns the output filename, using the default name if none is given and ensuring the extension
+def _output_filename(filename, extension):
+    if filename is None:
+        # timestamp = datetime.now().strftime('%d-%m-%Y-%I-%M-%S-%p')
+        filename = f"Techversant_Jobs_New.{extension}"
+    
+    if not filename.endswith(f'.{extension}'):
+        filename += f'.{extension}'
+    return filename
+
+# Saves the list of job dictionaries in the requested format: 'xlsx' (styled, slowest),
+# or 'csv' / 'parquet' (plain data, much faster for programmatic consumers)
+def save_jobs(jobs_data, output_format='xlsx', filename=None):
+    if output_format == 'xlsx':
+        return save_jobs_to_excel(jobs_data, filename)
+    if output_format == 'csv':
+        return save_jobs_to_csv(jobs_data, filename)
+    if output_format == 'parquet':
+        return save_jobs_to_parquet(jobs_data, filename)
+    raise ValueError(f"Unsupported output format: {output_format} (expected one of {', '.join(OUTPUT_FORMATS)})")
+
+# Saves the list of job dictionaries to an Excel file with formatting and summary (the styled, slow path)
 def save_jobs_to_excel(jobs_data, filename=None):
     if not jobs_data:
         raise ValueError("No job data provided to save")
     
-    # Generate filename if not provided
-    if filename is None:
-        # timestamp = datetime.now().strftime('%d-%m-%Y-%I-%M-%S-%p')
-        filename = f"Techversant_Jobs_New.xlsx"
-    
-    # Ensure .xlsx extension
-    if not filename.endswith('.xlsx'):
-        filename += '.xlsx'
+    # Generate filename if not provided and ensure .xlsx extension
+    filename = _output_filename(filename, 'xlsx')
     
     try:
-        # Create DataFrame by converting list of dicts to DataFrame
-        df = pd.DataFrame(jobs_data)
+        df = _jobs_dataframe(jobs_data)
         
-        # Reorder columns for better readability
-        column_order = [
-            'JobTitle', 'JobCategory', 'Location', 'ExperienceRequired', 
-            'PostingDate', 'JobDescriptionSummary', 'SkillsRequired', 
-            'ContactEmail', 'CompanyBenefits', 'Salary', 'JobURL', 
-            'JobID', 'ScrapedDate', 'SourceURL'
-        ]
-        
-        # Keep only columns that exist in the data
-        existing_columns = [col for col in column_order if col in df.columns]
-        df = df[existing_columns]
-        
-        # Replace empty strings with None for proper blank cells in Excel
-        df = df.replace('', None)
-        
-        # Create Excel writer object
-        with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-            # Write main data to 'Jobs' sheet
-            # index=False removes pandas index column (meets acceptance criteria)
-            df.to_excel(writer, sheet_name='Jobs', index=False)
+        # Create the workbook in constant-memory mode: each row is streamed to disk as soon as
+        # the next one starts, so rows must be written strictly top to bottom.
+        # URLs and '='-prefixed text are written as plain strings, not hyperlinks or formulas.
+        workbook_options = {'constant_memory': True, 'strings_to_urls': False, 'strings_to_formulas': False}
+        with xlsxwriter.Workbook(filename, workbook_options) as workbook:
+            worksheet = workbook.add_worksheet('Jobs')
+            
+            # Register the cell styles once; every styled cell and column references these objects
+            cell_formats = _add_cell_formats(workbook)
             
-            # Get the workbook and worksheet
-            workbook = writer.book
-            worksheet = writer.sheets['Jobs']
+            # Format the Excel file and write the header row (widths are computed up front from the DataFrame)
+            format_excel_worksheet(worksheet, df, cell_formats)
             
-            # Format the Excel file
-            format_excel_worksheet(worksheet, df)
+            # Write main data to 'Jobs' sheet, one row per call (no index column - meets acceptance criteria)
+            for row_idx, job in enumerate(jobs_data, 1):
+                # Missing values become formatted blank cells, so the whole table keeps its borders
+                worksheet.write_row(row_idx, 0, [job.get(field) for field in JOB_FIELDS], cell_formats['data'])
             
             # Create summary sheet
-            create_summary_sheet(workbook, df)
+            create_summary_sheet(workbook, df, cell_formats)
         
         print(f"✅ Successfully saved {len(jobs_data)} jobs to '{filename}'")
         return filename
@@ -200,108 +349,104 @@ def save_jobs_to_excel(jobs_data, filename=None):
         print(f"❌ Error saving to Excel: {str(e)}")
         raise
 
-# Formats the Excel worksheet for better readability (headers, borders, column widths)
-def format_excel_worksheet(worksheet, df):  
-    # Define styles
-    header_font = Font(bold=True, color='FFFFFF', size=12)
-    header_fill = PatternFill(start_color='366092', end_color='366092', fill_type='solid')
-    border = Border(
-        left=Side(style='thin'),
-        right=Side(style='thin'),
-        top=Side(style='thin'),
-        bottom=Side(style='thin')
-    )
+# Saves the list of job dictionaries to a plain CSV file (no styling or summary sheet)
+def save_jobs_to_csv(jobs_data, filename=None):
+    if not jobs_data:
+        raise ValueError("No job data provided to save")
     
-    # Format headers
-    for cell in worksheet[1]:
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.border = border
-        cell.alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
+    filename = _output_filename(filename, 'csv')
     
-    # Auto-adjust column widths and apply borders
-    for column in worksheet.columns:
-        max_length = 0
-        column_letter = column[0].column_letter
+    try:
+        _jobs_dataframe(jobs_data).to_csv(filename, index=False)
         
-        for cell in column:
-            cell.border = border
-            if cell.row > 1:  # Data rows
-                cell.alignment = Alignment(vertical='top', wrap_text=True)
-            
-            try:
-                if cell.value and len(str(cell.value)) > max_length:
-                    max_length = len(str(cell.value))
-            except:
-                pass
+        print(f"✅ Successfully saved {len(jobs_data)} jobs to '{filename}'")
+        return filename
         
-        # Set column width with limits
-        adjusted_width = min(max(max_length + 2, 15), 80)
-        worksheet.column_dimensions[column_letter].width = adjusted_width
+    except Exception as e:
+        print(f"❌ Error saving to CSV: {str(e)}")
+        raise
+
+# Saves the list of job dictionaries to a zstd-compressed Parquet file (requires pyarrow)
+def save_jobs_to_parquet(jobs_data, filename=None):
+    if not jobs_data:
+        raise ValueError("No job data provided to save")
+    
+    filename = _output_filename(filename, 'parquet')
     
-    # Set row height for better readability
-    for row in range(2, len(df) + 2):
-        worksheet.row_dimensions[row].height = 60
+    try:
+        _jobs_dataframe(jobs_data).to_parquet(filename, engine='pyarrow', compression='zstd', index=False)
+        
+        print(f"✅ Successfully saved {len(jobs_data)} jobs to '{filename}'")
+        return filename
+        
+    except Exception as e:
+        print(f"❌ Error saving to Parquet: {str(e)}")
+        raise
+
+# Adds the shared cell styles to the workbook and returns them by name
+def _add_cell_formats(workbook):
+    return {name: workbook.add_format(properties) for name, properties in _CELL_FORMATS.items()}
+
+# Formats the Excel worksheet for better readability (header style, row heights, column widths)
+# and writes the header row; the data rows are streamed in afterwards by the caller
+def format_excel_worksheet(worksheet, df, cell_formats):
+    # Set row height for better readability: one sheet-wide default instead of a record per row,
+    # with the header row kept shorter (set before the header is written and streamed out)
+    worksheet.set_default_row(60)
+    worksheet.set_row(0, 30)
+    
+    # Format headers
+    worksheet.write_row(0, 0, list(df.columns), cell_formats['header'])
+    
+    # Auto-adjust column widths: longest header/value per column, computed column-wise by pandas
+    header_lengths = pd.Series({column: len(str(column)) for column in df.columns})
+    value_lengths = df.fillna('').astype(str).apply(lambda column: column.str.len()).max()
+    column_widths = pd.concat([header_lengths, value_lengths], axis=1).max(axis=1).add(2).clip(lower=15, upper=80)
+    
+    # Set column width with limits (cell styles are applied per row, so borders stop at the last job)
+    for col_idx, column in enumerate(df.columns):
+        worksheet.set_column(col_idx, col_idx, float(column_widths[column]))
 
 # Creates a summary sheet in the Excel workbook with statistics and breakdowns
-def create_summary_sheet(workbook, df):
+def create_summary_sheet(workbook, df, cell_formats):
     
-    summary_sheet = workbook.create_sheet(title='Summary')
+    summary_sheet = workbook.add_worksheet('Summary')
     
     # Summary statistics
     summary_data = [
-        ['Metric', 'Value'],
         ['Total Jobs', len(df)],
         ['Scraping Date', datetime.now().strftime('%Y-%m-%d %H:%M:%S')],
         ['Source', 'Techversant Infotech'],
         ['Source URL', BASE_URL],
-        [''],
-        ['Jobs by Category', ''],
     ]
     
-    # Add category breakdown
-    if 'JobCategory' in df.columns:
-        category_counts = df['JobCategory'].value_counts()
-        for category, count in category_counts.items():
-            summary_data.append([f'  {category}', count])
-    
-    summary_data.extend([
-        [''],
-        ['Jobs by Location', ''],
-    ])
-    
-    # Add location breakdown
-    if 'Location' in df.columns:
-        location_counts = df['Location'].value_counts()
-        for location, count in location_counts.items():
-            summary_data.append([f'  {location}', count])
-    
-    # Write summary data
+    # Write summary data one row per call
+    summary_sheet.write_row(0, 0, ['Metric', 'Value'], cell_formats['summary_header'])
     for row_idx, row_data in enumerate(summary_data, 1):
-        for col_idx, value in enumerate(row_data, 1):
-            cell = summary_sheet.cell(row=row_idx, column=col_idx, value=value)
-            
-            # Format headers
-            if row_idx == 1 or (len(row_data) == 2 and row_data[1] == ''):
-                cell.font = Font(bold=True)
-                if row_idx == 1:
-                    cell.fill = PatternFill(start_color='366092', end_color='366092', fill_type='solid')
-                    cell.font = Font(bold=True, color='FFFFFF')
+        summary_sheet.write_row(row_idx, 0, row_data)
     
-    # Auto-adjust column widths
-    for column in summary_sheet.columns:
-        max_length = 0
-        column_letter = column[0].column_letter
+    # Track the longest value per column for the width adjustment below
+    column_values = [['Metric'] + [row[0] for row in summary_data], ['Value'] + [row[1] for row in summary_data]]
+    
+    # Add category and location breakdowns, one row per call (rows are streamed in order)
+    row_idx = len(summary_data) + 2  # leave a blank row after the statistics
+    for title, column in (('Jobs by Category', 'JobCategory'), ('Jobs by Location', 'Location')):
+        counts = df[column].value_counts()
+        labels = ('  ' + counts.index.astype(str)).tolist()
         
-        for cell in column:
-            try:
-                if cell.value and len(str(cell.value)) > max_length:
-                    max_length = len(str(cell.value))
-            except:
-                pass
+        summary_sheet.write(row_idx, 0, title, cell_formats['section'])
+        for offset, label_count in enumerate(zip(labels, counts.tolist()), 1):
+            summary_sheet.write_row(row_idx + offset, 0, label_count)
         
+        column_values[0].extend([title] + labels)
+        column_values[1].extend(counts.tolist())
+        row_idx += len(counts) + 2  # heading row + blank row before the next breakdown
+    
+    # Auto-adjust column widths
+    for col_idx, values in enumerate(column_values):
+        max_length = max(len(str(value)) for value in values)
         adjusted_width = max(max_length + 2, 15)
-        summary_sheet.column_dimensions[column_letter].width = adjusted_width
+        summary_sheet.set_column(col_idx, col_idx, adjusted_width)
 
 # Validates the completeness of the scraped job data
 def validate_scraped_data(jobs_data):
@@ -326,49 +471,81 @@ def validate_scraped_data(jobs_data):
     
     return True
 
-# Main function to scrape jobs from the target website
-def scrape_jobs():
+# Main function to scrape jobs from the target website and save them in the given output format
+def scrape_jobs(output_format='xlsx'):
+    
+    # Parquet needs the optional pyarrow package - check before scraping rather than failing at save time
+    if output_format == 'parquet' and importlib.util.find_spec('pyarrow') is None:
+        print("❌ Parquet output requires pyarrow")
+        print("💡 Install it with: pip install pyarrow")
+        return None
     
     try:
         print("🔍 Starting job scraping from Techversant...")
         
         # Make request to the careers page
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        
-        response = requests.get(BASE_URL, headers=headers, timeout=30)
+        response = _SESSION.get(BASE_URL, timeout=30)
         response.raise_for_status()
         
         # Parse HTML
-        soup = BeautifulSoup(response.content, 'html.parser')
+        tree = lxml.html.fromstring(response.content, parser=_HTML_PARSER)
+        
+        # Find all job sections, remembering which page each one came from
+        job_sections = _XP_JOB_SECTIONS(tree)
+        source_urls = [BASE_URL] * len(job_sections)
         
         # Check for pagination (acceptance criteria requirement)
-        has_pagination = check_pagination(soup)
+        has_pagination = check_pagination(tree)
+        seen_urls = {_canonical_page_url(BASE_URL)}
+        page_urls = collect_page_urls(tree, BASE_URL, seen_urls) if has_pagination else []
+        # The page tree itself is no longer needed (the sections keep their document alive on their own)
+        del tree
+        
         if has_pagination:
-            print("📄 Pagination detected - currently scraping first page only")
-            print("💡 Future versions could implement multi-page scraping")
+            if page_urls:
+                pages = asyncio.run(_scrape_all_pages(page_urls, seen_urls))
+                print(f"📄 Pagination detected - fetched {len(pages)} more page(s)")
+                for page_url, page_tree in pages:
+                    if isinstance(page_tree, Exception):
+                        print(f"⚠️  Skipped page {page_url}: {str(page_tree)}")
+                        continue
+                    page_sections = _XP_JOB_SECTIONS(page_tree)
+                    job_sections.extend(page_sections)
+                    source_urls.extend([page_url] * len(page_sections))
+                # Clear the loop's own references so only job_sections keeps the page trees alive
+                pages = page_tree = page_sections = None
+            else:
+                print("📄 Pagination detected but no page links found - scraping first page only")
         else:
             print("📄 No pagination detected - scraping all available jobs")
         
-        # Find all job sections
-        job_sections = soup.find_all('section', class_='crr_app_stt')
-        
         if not job_sections:
             print("❌ No job sections found. The website structure might have changed.")
             return None
         
-        print(f"📋 Found {len(job_sections)} job postings")
+        job_count = len(job_sections)
+        print(f"📋 Found {job_count} job postings")
         
         # Extract data from each job (store as dictionaries, append to list)
         jobs_data = []  # List to store job dictionaries
         successful_extractions = 0
 
-        for i, job_section in enumerate(job_sections, 1):
-            print(f"📝 Processing job {i}/{len(job_sections)}...")
-            # Extract job data and return as dictionary
-            job_data = extract_job_data(job_section)
-            
+        # Jobs are independent: large batches are spread over worker processes (as serialized HTML),
+        # smaller ones are extracted directly from the parsed elements
+        if job_count >= _PROCESS_POOL_MIN_JOBS:
+            html_blobs = _serialize_sections(job_sections)
+            # The sections are now the only references to the page trees - drop them so the
+            # trees are freed before the workers start
+            job_sections = None
+            with ProcessPoolExecutor() as executor:
+                # map() yields results in submission order, so job numbers match the page order
+                extracted_jobs = list(executor.map(_extract_from_html, html_blobs, source_urls, chunksize=8))
+        else:
+            extracted_jobs = map(_extract_job_or_none, job_sections, source_urls)
+
+        for i, job_data in enumerate(extracted_jobs, 1):
+            print(f"📝 Processing job {i}/{job_count}...")
+
             # Only append if extraction was successful (not None)
             if job_data:
                 jobs_data.append(job_data)  # Append dictionary to list
@@ -376,15 +553,21 @@ def scrape_jobs():
             else:
                 print(f"⚠️  Skipped job {i} due to extraction error")
         
-        print(f"✅ Successfully extracted {successful_extractions}/{len(job_sections)} jobs")
+        print(f"✅ Successfully extracted {successful_extractions}/{job_count} jobs")
+        
+        # The same posting can be linked from several result pages - keep its first occurrence
+        unique_jobs = _dedupe_jobs(jobs_data)
+        if len(unique_jobs) < len(jobs_data):
+            print(f"🔁 Removed {len(jobs_data) - len(unique_jobs)} duplicate job posting(s)")
+            jobs_data = unique_jobs
         
         # Validate data quality
         if not validate_scraped_data(jobs_data):
             print("⚠️  Data validation concerns detected")
         
-        # Save to Excel (convert list of dictionaries to DataFrame)
+        # Save to file (convert list of dictionaries to DataFrame)
         if jobs_data:
-            filename = save_jobs_to_excel(jobs_data)
+            filename = save_jobs(jobs_data, output_format)
             print(f"\n✅ Scraping completed successfully!")
             print(f"📁 File saved as: {filename}")
             print(f"📊 Total jobs scraped: {len(jobs_data)}")
@@ -402,8 +585,13 @@ def scrape_jobs():
         return None
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Scrape Techversant job postings into a file")
+    parser.add_argument('--format', choices=OUTPUT_FORMATS, default='xlsx',
+                        help="output format: styled Excel (default), or plain CSV / Parquet for faster writes")
+    args = parser.parse_args()
+    
     # Run the scraping
-    result = scrape_jobs()
+    result = scrape_jobs(args.format)
     
     if result:
         print(f"\n🎉 Job scraping completed! Check '{result}' for results.")